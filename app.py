@@ -1,7 +1,16 @@
 import streamlit as st
-import random
+import hashlib
+import os
+import re
+import secrets
 import string
-import pandas as pd
+import pyarrow as pa
+
+# Optional Bloom filter backend for large external blacklists
+try:
+    from rbloom import Bloom
+except ImportError:
+    Bloom = None
 
 # Configuration
 st.set_page_config(
@@ -12,8 +21,18 @@ st.set_page_config(
 
 
 # Initialize session state variables
+# Analysis history is an Arrow table that only grows by appended rows
+_HISTORY_SCHEMA = pa.schema([
+    ("password", pa.string()),
+    ("strength", pa.string()),
+    ("score", pa.float64()),
+    ("max_score", pa.float64())
+])
 if 'password_analysis' not in st.session_state:
-    st.session_state.password_analysis = []
+    st.session_state.password_analysis = _HISTORY_SCHEMA.empty_table()
+# Short digests of passwords already in the history, to skip repeats
+if 'analyzed_hashes' not in st.session_state:
+    st.session_state.analyzed_hashes = set()
 if 'generated_passwords' not in st.session_state:
     st.session_state.generated_passwords = []
 
@@ -23,78 +42,153 @@ BLACKLIST = {
     "qwerty", "letmein", "monkey", "sunshine", "iloveyou"
 }
 
+# Optional newline-separated list of common passwords (e.g. 10^6 entries)
+BLACKLIST_FILE = os.environ.get("PASSWORD_BLACKLIST_FILE")
+
+def _load_blacklist_file(path):
+    """Load an external blacklist into a Bloom filter (or a frozenset without rbloom)"""
+    with open(path, encoding="utf-8", errors="ignore") as f:
+        entries = {line.strip().lower() for line in f if line.strip()}
+    lengths = frozenset(len(p) for p in entries)
+    if Bloom is None:
+        return frozenset(entries), lengths
+    # A 0.1% false positive only rejects a password that wasn't listed
+    bloom = Bloom(max(len(entries), 1), 0.001)
+    bloom.update(entries)
+    return bloom, lengths
+
+# Strength labels indexed by how many thresholds (40%, 80%) the score reaches
+_STRENGTH = ("Weak", "Moderate", "Strong")
+
+# Improvement hints per criterion (bit i of a feedback mask = i-th hint)
+_CRITERIA_HINTS = {
+    "length": "✅ More characters (minimum 8)",
+    "uppercase": "✅ Uppercase letters",
+    "lowercase": "✅ Lowercase letters",
+    "digit": "✅ Numbers",
+    "special": "✅ Special characters"
+}
+
+# Lookup tables shared by every session in the process (the script body
+# reruns on each interaction, so they are built through cache_resource)
+@st.cache_resource(show_spinner=False)
+def _load_blacklist_assets():
+    """Build the blacklist filters and the feedback text for every missing-criteria mask"""
+    if BLACKLIST_FILE:
+        external_bl, external_lengths = _load_blacklist_file(BLACKLIST_FILE)
+    else:
+        external_bl, external_lengths = frozenset(), frozenset()
+    
+    return {
+        "bl": frozenset(BLACKLIST),
+        "external_bl": external_bl,
+        "bl_lengths": frozenset(len(p) for p in BLACKLIST) | external_lengths,
+        "feedback_table": tuple(
+            "\n".join(
+                ["💡 Strengthen your password by adding:"]
+                + [hint for bit, hint in enumerate(_CRITERIA_HINTS.values()) if mask >> bit & 1]
+            )
+            for mask in range(1 << len(_CRITERIA_HINTS))
+        )
+    }
+
+# Precompiled character class patterns for criteria checks
+_RE_UPPER = re.compile(r"[A-Z]")
+_RE_LOWER = re.compile(r"[a-z]")
+_RE_DIGIT = re.compile(r"[0-9]")
+_RE_SPECIAL = re.compile(f"[{re.escape(string.punctuation)}]")
+
+# Character pools for the password generator
+_POOL = string.ascii_letters + string.digits + string.punctuation
+_CLASS_POOLS = (
+    string.ascii_uppercase,
+    string.ascii_lowercase,
+    string.digits,
+    string.punctuation
+)
+_rng = secrets.SystemRandom()
+
+# Random byte -> pool character table for batch generation; bytes past the
+# last full multiple of len(_POOL) are dropped to avoid modulo bias
+_BYTE_TABLE = bytes(ord(_POOL[b % len(_POOL)]) for b in range(256))
+_BYTE_REJECT = bytes(range(256 - 256 % len(_POOL), 256))
+
+def _finish_password(password):
+    """Ensure each character type is present, then shuffle into a string"""
+    for i, pool in enumerate(_CLASS_POOLS):
+        password[i] = _rng.choice(pool)
+    _rng.shuffle(password)
+    return ''.join(password)
+
 # Custom password generator
 def generate_strong_password(length=12):
     """Generate a strong password meeting all criteria"""
     if length < 8:
         length = 8
         
-    # Ensure minimum representation of each character type
-    uppercase = random.choice(string.ascii_uppercase)
-    lowercase = random.choice(string.ascii_lowercase)
-    digit = random.choice(string.digits)
-    special = random.choice(string.punctuation)
+    # Sample every position from the full pool in one call
+    return _finish_password(_rng.choices(_POOL, k=length))
+
+def generate_strong_passwords(n, length=12):
+    """Generate n strong passwords from one bulk os.urandom buffer"""
+    if length < 8:
+        length = 8
     
-    # Generate remaining characters
-    remaining = length - 4
-    all_chars = string.ascii_letters + string.digits + string.punctuation
-    password = [uppercase, lowercase, digit, special] + random.choices(all_chars, k=remaining)
+    # Map random bytes to pool characters in C, topping up rejected bytes
+    needed = n * length
+    chars = b""
+    while len(chars) < needed:
+        missing = needed - len(chars)
+        chars += os.urandom(missing * 3 // 2 + 16).translate(_BYTE_TABLE, _BYTE_REJECT)
+    chars = chars[:needed].decode("ascii")
     
-    # Shuffle and convert to string
-    random.shuffle(password)
-    return ''.join(password)
+    return [
+        _finish_password(list(chars[i:i + length]))
+        for i in range(0, needed, length)
+    ]
 
 # Password strength analyzer
-def analyze_password(password, weights):
-    """Analyze password strength with custom weights"""
-    # Blacklist check
-    if password.lower() in BLACKLIST:
-        return {
-            "error": True,
-            "message": "❌ Commonly used password detected! Please choose a different one."
-        }
+@st.cache_data(max_entries=256, show_spinner=False)
+def analyze_password(password, weights, max_score):
+    """Analyze password strength with custom weights (passed as a sorted tuple of items)"""
+    weights = dict(weights)
+    assets = _load_blacklist_assets()
     
-    # Criteria checks
+    # Blacklist check (skip lowercasing when no entry has a matching length)
+    if len(password) in assets["bl_lengths"]:
+        lowered = password.lower()
+        if lowered in assets["bl"] or lowered in assets["external_bl"]:
+            return {
+                "error": True,
+                "message": "❌ Commonly used password detected! Please choose a different one."
+            }
+    
+    # Criteria checks (compiled regex scans stop at the first match)
     criteria = {
         "length": len(password) >= 8,
-        "uppercase": any(c.isupper() for c in password),
-        "lowercase": any(c.islower() for c in password),
-        "digit": any(c.isdigit() for c in password),
-        "special": any(c in string.punctuation for c in password)
+        "uppercase": _RE_UPPER.search(password) is not None,
+        "lowercase": _RE_LOWER.search(password) is not None,
+        "digit": _RE_DIGIT.search(password) is not None,
+        "special": _RE_SPECIAL.search(password) is not None
     }
     
     # Score calculation
     total_score = sum(weight for criterion, weight in weights.items() if criteria[criterion])
-    max_score = sum(weights.values())
     
-    # Determine strength level
-    if max_score == 0:
-        strength = "Weak"
-    else:
-        score_percent = (total_score / max_score) * 100
-        if score_percent >= 80:
-            strength = "Strong"
-        elif score_percent >= 40:
-            strength = "Moderate"
-        else:
-            strength = "Weak"
+    # Determine strength level (bucket index into _STRENGTH)
+    score_percent = (total_score / max_score) * 100 if max_score else 0
+    level = int(score_percent >= 40) + int(score_percent >= 80)
+    strength = _STRENGTH[level]
     
-    # Generate feedback
-    feedback = []
-    if strength != "Strong":
-        missing = [k for k, v in criteria.items() if not v]
-        feedback.append("💡 Strengthen your password by adding:")
-        for criterion in missing:
-            if criterion == "length":
-                feedback.append("✅ More characters (minimum 8)")
-            elif criterion == "uppercase":
-                feedback.append("✅ Uppercase letters")
-            elif criterion == "lowercase":
-                feedback.append("✅ Lowercase letters")
-            elif criterion == "digit":
-                feedback.append("✅ Numbers")
-            elif criterion == "special":
-                feedback.append("✅ Special characters")
+    # Look up feedback by the bitmask of missing criteria
+    if level < 2:
+        mask = 0
+        for bit, criterion in enumerate(_CRITERIA_HINTS):
+            if not criteria[criterion]:
+                mask |= 1 << bit
+        feedback = assets["feedback_table"][mask]
+    else:
+        feedback = "✅ Perfectly secure password!"
     
     return {
         "error": False,
@@ -102,140 +196,157 @@ def analyze_password(password, weights):
         "score": total_score,
         "max_score": max_score,
         "strength": strength,
-        "feedback": "\n".join(feedback) if feedback else "✅ Perfectly secure password!"
+        "feedback": feedback
     }
 
+# Tab bodies run as fragments so their widgets only rerun their own tab
+@st.fragment
+def _analyzer_tab():
+    """Password analyzer tab (weights are read from session state)"""
+    st.header("🔍 Password Strength Checker")
+    user_password = st.text_input("Enter your password to analyze:", type="password")
+    if st.button("Analyze Password"):
+        if not user_password:
+            st.warning("Please enter a password to analyze!")
+        else:
+            analysis = analyze_password(
+                user_password,
+                st.session_state.weights_key,
+                st.session_state.max_score
+            )
+
+            if analysis["error"]:
+                st.error(analysis["message"])
+            else:
+                # Display results
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.subheader("Security Score")
+                    st.metric(
+                        label="Password Strength",
+                        value=analysis["strength"],
+                        delta=f"{analysis['score']:.1f} / {analysis['max_score']:.1f}"
+                    )
+
+                with col2:
+                    st.subheader("Security Recommendation")
+                    st.info(analysis["feedback"])
+
+                    st.subheader("Password Complexity Visualization")
+                    progress = analysis["score"] / analysis["max_score"]
+                    st.progress(progress, text=f"Security Level: {progress:.0%}")
+
+                # Criteria row spans the full width below the score panels
+                st.subheader("Criteria Met")
+                labels = ("Length", "Uppercase", "Lowercase", "Digit", "Special")
+                for col, label, met in zip(st.columns(5), labels, analysis["criteria"].values()):
+                    col.metric(label, "✅" if met else "❌")
+
+                # Store analysis result in session state (once per password)
+                digest = hashlib.blake2b(user_password.encode(), digest_size=8).digest()
+                if digest not in st.session_state.analyzed_hashes:
+                    st.session_state.analyzed_hashes.add(digest)
+                    new_row = pa.Table.from_pydict({
+                        "password": [user_password],
+                        "strength": [analysis["strength"]],
+                        "score": [analysis["score"]],
+                        "max_score": [analysis["max_score"]]
+                    }, schema=_HISTORY_SCHEMA)
+                    st.session_state.password_analysis = pa.concat_tables(
+                        [st.session_state.password_analysis, new_row]
+                    )
+
+@st.fragment
+def _generator_tab():
+    """Password generator tab"""
+    st.header("🌟 Secure Password Generator")
+    pass_length = st.slider("Select password length:", 8, 32, 12)
+    include_numbers = st.checkbox("Include Numbers", value=True)
+    include_special = st.checkbox("Include Special Characters", value=True)
+
+    if st.button("Generate Secure Password"):
+        generated = generate_strong_password(pass_length)
+        st.success(f"Generated Password: {generated}")
+        st.download_button(
+            "Download Password",
+            generated,
+            file_name="secure_password.txt",
+            mime="text/plain"
+        )
+
+        # Store generated password in session state
+        st.session_state.generated_passwords.append(generated)
+
+@st.fragment
+def _dashboard_tab():
+    """Security dashboard tab"""
+    st.header("🛡️ Security Dashboard")
+    # Analyzer/generator fragments don't rerun this tab, so allow a local refresh
+    st.button("Refresh Dashboard")
+
+    # Display Password Analysis Results
+    st.subheader("Password Analysis Results")
+    if st.session_state.password_analysis.num_rows:
+        # Arrow tables are passed through without a pandas round-trip
+        st.dataframe(st.session_state.password_analysis, use_container_width=True)
+    else:
+        st.write("No password analysis results yet.")
+
+    # Display Generated Passwords
+    st.subheader("Generated Passwords")
+    if st.session_state.generated_passwords:
+        st.code("\n".join(st.session_state.generated_passwords), language=None)
+    else:
+        st.write("No passwords generated yet.")
+
+    # Display Trends
+    st.markdown("""
+
+    ### Security Trends
+    - 📈 89% of users improved password strength after recommendations
+    - 📉 12% reduction in common password usage last month
+    """)
+
+    st.markdown("---")
+    st.markdown("#### Created by Amjad Afzal Ahmed")
+
 # Streamlit UI
 def main():
+    # Warm the shared lookup tables before any analysis
+    _load_blacklist_assets()
+    
     # Sidebar with customization options
     st.sidebar.header("Security Settings ⚙️")
     st.sidebar.markdown("---")
     st.sidebar.subheader("Customize Password Scoring")
     st.sidebar.markdown("---")
-    weights = {
-        "length": st.sidebar.number_input("Length Weight", 0.0, 5.0, 1.0, 0.1),
-        "uppercase": st.sidebar.number_input("Uppercase Weight", 0.0, 5.0, 1.0, 0.1),
-        "lowercase": st.sidebar.number_input("Lowercase Weight", 0.0, 5.0, 1.0, 0.1),
-        "digit": st.sidebar.number_input("Digit Weight", 0.0, 5.0, 1.0, 0.1),
-        "special": st.sidebar.number_input("Special Character Weight", 0.0, 5.0, 1.0, 0.1),
-    }
+    # Batch weight changes into a single rerun
+    with st.sidebar.form("weights_form"):
+        weights = {
+            "length": st.number_input("Length Weight", 0.0, 5.0, 1.0, 0.1),
+            "uppercase": st.number_input("Uppercase Weight", 0.0, 5.0, 1.0, 0.1),
+            "lowercase": st.number_input("Lowercase Weight", 0.0, 5.0, 1.0, 0.1),
+            "digit": st.number_input("Digit Weight", 0.0, 5.0, 1.0, 0.1),
+            "special": st.number_input("Special Character Weight", 0.0, 5.0, 1.0, 0.1),
+        }
+        st.form_submit_button("Apply")
+    st.session_state.weights_key = tuple(sorted(weights.items()))
+    st.session_state.max_score = sum(weights.values())
     
     # Main content tabs
     tab1, tab2, tab3 = st.tabs(["🔐 Password Strength Meter", "🤖 Password Generator", "📊 Security Dashboard"])
     
     # Password Analyzer Tab
     with tab1:
-        st.header("🔍 Password Strength Checker")
-        user_password = st.text_input("Enter your password to analyze:", type="password")
-        if st.button("Analyze Password"):
-            if not user_password:
-                st.warning("Please enter a password to analyze!")
-            else:
-                analysis = analyze_password(user_password, weights)
-                
-                if analysis["error"]:
-                    st.error(analysis["message"])
-                else:
-                    # Display results
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.subheader("Security Score")
-                        st.metric(
-                            label="Password Strength",
-                            value=analysis["strength"],
-                            delta=f"{analysis['score']:.1f} / {analysis['max_score']:.1f}"
-                        )
-                        
-                        st.subheader("Criteria Met")
-                        criteria_df = pd.DataFrame({
-                            "Criteria": ["Length", "Uppercase", "Lowercase", "Digit", "Special"],
-                            "Status": [
-                                "✅" if analysis["criteria"]["length"] else "❌",
-                                "✅" if analysis["criteria"]["uppercase"] else "❌",
-                                "✅" if analysis["criteria"]["lowercase"] else "❌",
-                                "✅" if analysis["criteria"]["digit"] else "❌",
-                                "✅" if analysis["criteria"]["special"] else "❌"
-                            ]
-                        })
-                        st.dataframe(criteria_df.set_index("Criteria"), use_container_width=True)
-                    
-                    with col2:
-                        st.subheader("Security Recommendation")
-                        st.info(analysis["feedback"])
-                        
-                        st.subheader("Password Complexity Visualization")
-                        progress = analysis["score"] / analysis["max_score"]
-                        st.progress(progress, text=f"Security Level: {progress:.0%}")
-                    
-                    # Store analysis result in session state
-                    st.session_state.password_analysis.append({
-                        "password": user_password,
-                        "strength": analysis["strength"],
-                        "score": analysis["score"],
-                        "max_score": analysis["max_score"]
-                    })
+        _analyzer_tab()
     
     # Password Generator Tab
     with tab2:
-        st.header("🌟 Secure Password Generator")
-        pass_length = st.slider("Select password length:", 8, 32, 12)
-        include_numbers = st.checkbox("Include Numbers", value=True)
-        include_special = st.checkbox("Include Special Characters", value=True)
-        
-        if st.button("Generate Secure Password"):
-            generated = generate_strong_password(pass_length)
-            st.success(f"Generated Password: {generated}")
-            st.download_button(
-                "Download Password",
-                generated,
-                file_name="secure_password.txt",
-                mime="text/plain"
-            )
-            
-            # Store generated password in session state
-            st.session_state.generated_passwords.append(generated)
+        _generator_tab()
     
     # Security Dashboard Tab
     with tab3:
-        st.header("🛡️ Security Dashboard")
-        
-        # Display Password Analysis Results
-        st.subheader("Password Analysis Results")
-        if st.session_state.password_analysis:
-            analysis_df = pd.DataFrame(st.session_state.password_analysis)
-            st.dataframe(analysis_df, use_container_width=True)
-        else:
-            st.write("No password analysis results yet.")
-        
-        # Display Generated Passwords
-        st.subheader("Generated Passwords")
-        if st.session_state.generated_passwords:
-            for password in st.session_state.generated_passwords:
-                st.write(password)
-        else:
-            st.write("No passwords generated yet.")
-        
-        # Display Trends
-        st.markdown("""
-              
-        ### Security Trends
-        - 📈 89% of users improved password strength after recommendations
-        - 📉 12% reduction in common password usage last month
-        """)
-        
-        st.markdown("---")
-        st.markdown("""
-                    <style>
-                        .footer {
-                        font-size: 32px;
-                        text-align: center;
-                        color: #FEE715; /* Yellow color */
-                        font-weight: bold;
-                        margin-top: 20px;
-                            }
-                    </style>
-                    <div class='footer'>Created by Amjad Afzal Ahmed</div>
-                    """, unsafe_allow_html=True)
+        _dashboard_tab()
 
 
 if __name__ == "__main__":